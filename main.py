@@ -9,8 +9,8 @@ from src.duplicate_organizer import (
     load_report,
     validate_report,
     get_files_to_remove,
-    remove_files,
-    trash_files,
+    execute_removal,
+    clear_journal,
     clear_checkpoint,
     validate_checkpoint,
 )
@@ -24,6 +24,27 @@ def _run_scan(config):
     return grouped
 
 
+def _journal_path(report_path):
+    '''Return the removal journal path that belongs to a report.'''
+    return report_path + '.journal'
+
+
+def _run_removal(report, report_path, delete_mode):
+    '''Run the removal executor with a tqdm progress bar and print a summary.'''
+    to_remove = get_files_to_remove(report)
+    pbar = tqdm(total=len(to_remove), desc="Removing", unit=" files")
+    summary = execute_removal(report, _journal_path(report_path), delete_mode=delete_mode,
+                              on_progress=lambda f: pbar.update(1))
+    pbar.close()
+
+    print(f'{summary["removed"]} file(s) removed, {summary["missing"]} already gone, '
+          f'{summary["failed"]} failed, {summary["skipped"]} already done in a previous run.')
+    print(f'Took {summary["elapsed"]:.1f}s ({summary["files_per_second"]:.1f} files/s).')
+    for path, reason in summary['errors']:
+        print(f'  FAILED: {path} ({reason})')
+    return summary
+
+
 def _review_and_execute(report_path):
     '''Load a report, show summary, and prompt for deletion.'''
     report = load_report(report_path)
@@ -41,13 +62,11 @@ def _review_and_execute(report_path):
     choice = input('Enter 1 or 2: ')
 
     if choice == '1':
-        trash_files(to_remove)
-        print(f'Moved {len(to_remove)} file(s) to trash.')
+        _run_removal(report, report_path, 'trash')
     elif choice == '2':
         confirm = input('This is irreversible. Are you sure? Y/N: ')
         if confirm.lower() == 'y':
-            remove_files(to_remove)
-            print(f'Permanently removed {len(to_remove)} file(s).')
+            _run_removal(report, report_path, 'permanent')
         else:
             print('Deletion cancelled.')
     else:
@@ -73,6 +92,7 @@ if __name__ == '__main__':
             else:
                 report_path = config.report_path
                 generate_report(grouped, report_path, keep_rule=config.default_keep_rule)
+                clear_journal(_journal_path(report_path))
                 total = sum(len(f) for f in grouped.values())
                 print(f'Found {len(grouped)} duplicate group(s) ({total} files total).')
                 print(f'Report written to: {report_path}\n')
@@ -99,6 +119,7 @@ if __name__ == '__main__':
             else:
                 report_path = config.report_path
                 generate_report(grouped, report_path, keep_rule=config.default_keep_rule)
+                clear_journal(_journal_path(report_path))
                 total = sum(len(f) for f in grouped.values())
                 print(f'Found {len(grouped)} duplicate group(s) ({total} files total).')
                 print(f'Report written to: {report_path}\n')
@@ -1,5 +1,5 @@
 from .config import ScanConfig
 from .scanner import find_all_duplicate_files
-from .file_operations import remove_files, trash_files
+from .file_operations import remove_files, trash_files, execute_removal, clear_journal
 from .report import generate_report, load_report, validate_report, get_files_to_remove
 from .checkpoint import clear_checkpoint, validate_checkpoint
@@ -1,7 +1,20 @@
+import logging
 import os
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from send2trash import send2trash
 
+from .report import _format_size, _format_time, get_files_to_remove
+
+# send2trash picks a free name in the trash folder and then renames into it,
+# so concurrent calls can pick the same name and overwrite each other.
+_TRASH_LOCK = threading.Lock()
+
+_MISSING = 'File not found'
+
 
 def remove_files(file_list):
     '''Permanently remove all files whose paths are listed in the given list.
@@ -32,3 +45,195 @@ def trash_files(file_list):
     '''
     for file in file_list:
         send2trash(file)
+
+
+def clear_journal(journal_path):
+    '''Delete a removal journal file entirely.
+
+    Call this whenever a new report is generated at the same path, so
+    paths completed in an earlier run are not skipped.
+
+    Parameters:
+        journal_path: Path to the journal file written by execute_removal().
+
+    Returns:
+        None.
+    '''
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+
+
+def _trash_file(path):
+    '''Move a single file to the OS trash, one call at a time.'''
+    with _TRASH_LOCK:
+        send2trash(path)
+
+
+def _read_journal(journal_path):
+    '''Load the set of paths already completed in a previous execution run.
+
+    Lines that cannot be parsed (e.g. a partial line left behind by a crash)
+    are ignored.
+
+    Parameters:
+        journal_path: Path to the journal file written by execute_removal().
+
+    Returns:
+        A set of file path strings recorded as DONE or MISSING.
+    '''
+    done = set()
+    if not os.path.exists(journal_path):
+        return done
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.endswith('\n'):
+                continue
+            parts = line.rstrip('\n').split('\t', 2)
+            if len(parts) == 3 and parts[0] in ('DONE', 'MISSING'):
+                done.add(parts[2])
+    return done
+
+
+def _check_unchanged(entry):
+    '''Compare a file on disk against the size and mtime recorded in the report.
+
+    Parameters:
+        entry: A dict from load_report() with "path", "last_modified", and "size".
+
+    Returns:
+        None if the file still matches the report, otherwise a short reason string.
+    '''
+    try:
+        stat = os.stat(entry['path'])
+    except FileNotFoundError:
+        return _MISSING
+    if entry.get('size') is not None and _format_size(stat.st_size) != entry['size']:
+        return 'Size changed since report'
+    if entry.get('last_modified') is not None and _format_time(stat.st_mtime) != entry['last_modified']:
+        return 'Modified since report'
+    return None
+
+
+def execute_removal(report, journal_path, delete_mode='trash', max_workers=8, on_progress=None):
+    '''Remove every file marked REMOVE in a report using a pool of worker threads.
+
+    Files are grouped by parent directory and each directory is handled as
+    one batch by a worker. Before acting on a file, its size and last
+    modified time are re-checked against the report; files that changed are
+    skipped and recorded as failed. Files that no longer exist are recorded
+    as missing, since they may have been removed by an earlier run that was
+    interrupted before it could write to the journal. Moves to the trash
+    are serialised; permanent deletes run in parallel.
+
+    Every operation is appended to a tab-separated journal file (ACTION,
+    MODE or REASON, PATH). If the run is interrupted, calling this again
+    with the same journal_path skips files already recorded as DONE or
+    MISSING. Errors on one file do not stop the rest of the run, but any
+    unexpected exception stops all workers before it is raised.
+
+    Parameters:
+        report:       A list of dicts from load_report().
+        journal_path: Path of the append-only journal file.
+        delete_mode:  "trash" to move files to the OS trash, or "permanent"
+                      to delete them with os.remove().
+        max_workers:  Maximum number of worker threads.
+        on_progress:  Optional callback called with (file_path) after each
+                      file is processed, including files skipped because
+                      they are already in the journal. Use this to drive a
+                      progress bar.
+
+    Returns:
+        A dict summarising the run with keys "removed", "missing", "failed",
+        "skipped" (already done in a previous run), "errors" (list of
+        (path, reason) tuples), "elapsed" (seconds), and "files_per_second".
+
+    Raises:
+        ValueError: If delete_mode is not "trash" or "permanent".
+    '''
+    if delete_mode == 'trash':
+        action = _trash_file
+    elif delete_mode == 'permanent':
+        action = os.remove
+    else:
+        raise ValueError(f'Invalid delete_mode \'{delete_mode}\'')
+
+    entries = {entry['path']: entry for entry in report}
+    already_done = _read_journal(journal_path)
+    all_remove = get_files_to_remove(report)
+    to_remove = [path for path in all_remove if path not in already_done]
+
+    if on_progress is not None:
+        for path in all_remove:
+            if path in already_done:
+                on_progress(path)
+
+    batches = {}
+    for path in to_remove:
+        batches.setdefault(os.path.dirname(path), []).append(path)
+
+    summary = {
+        'removed': 0,
+        'missing': 0,
+        'failed': 0,
+        'skipped': len(all_remove) - len(to_remove),
+        'errors': [],
+    }
+    lock = threading.Lock()
+    stop = threading.Event()
+    start = time.monotonic()
+
+    with open(journal_path, 'a', encoding='utf-8') as journal:
+
+        def record(path, error):
+            with lock:
+                if error is None:
+                    journal.write(f'DONE\t{delete_mode}\t{path}\n')
+                    summary['removed'] += 1
+                elif error == _MISSING:
+                    journal.write(f'MISSING\t{delete_mode}\t{path}\n')
+                    summary['missing'] += 1
+                else:
+                    reason = ' '.join(error.split())
+                    journal.write(f'FAILED\t{reason}\t{path}\n')
+                    summary['failed'] += 1
+                    summary['errors'].append((path, reason))
+                journal.flush()
+                if on_progress is not None:
+                    on_progress(path)
+
+        def run_batch(paths):
+            for path in paths:
+                if stop.is_set():
+                    return
+                error = _check_unchanged(entries[path])
+                if error is None:
+                    try:
+                        action(path)
+                    except FileNotFoundError:
+                        error = _MISSING
+                    except Exception as e:
+                        error = str(e) or type(e).__name__
+                record(path, error)
+            with lock:
+                os.fsync(journal.fileno())
+
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [pool.submit(run_batch, paths) for paths in batches.values()]
+            for future in as_completed(futures):
+                future.result()
+        except KeyboardInterrupt:
+            stop.set()
+            logging.info('Removal interrupted. Progress has been saved to journal.')
+            raise
+        except BaseException:
+            stop.set()
+            logging.error(traceback.format_exc())
+            raise
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    summary['elapsed'] = time.monotonic() - start
+    processed = summary['removed'] + summary['missing'] + summary['failed']
+    summary['files_per_second'] = processed / summary['elapsed'] if summary['elapsed'] > 0 else 0.0
+    return summary
@@ -1,4 +1,5 @@
 import os
+import re
 from datetime import datetime
 
 
@@ -151,7 +152,9 @@ def load_report(report_path):
         report_path: Path to the report file to parse.
 
     Returns:
-        A list of dicts, each with "action" (str) and "path" (str) keys.
+        A list of dicts, each with "action", "path", "last_modified", and
+        "size" keys. "last_modified" and "size" are the formatted strings
+        written to the report (e.g. "2025-03-15 10:30" and "200.0KB").
 
     Raises:
         ValueError: If the file is missing, malformed, or any group has zero KEEP entries.
@@ -161,13 +164,23 @@ def load_report(report_path):
         raise ValueError(message)
 
     entries = []
+    current_size = None
     with open(report_path, 'r', encoding='utf-8') as f:
         for line in f:
             line = line.rstrip('\n')
-            if line.startswith('#') or line.strip() == '':
+            if line.startswith('#'):
+                match = re.search(r'\[size: ([^\]]+)\]', line)
+                current_size = match.group(1) if match else None
+                continue
+            if line.strip() == '':
                 continue
             parts = line.split('\t')
-            entries.append({'action': parts[0], 'path': parts[2]})
+            entries.append({
+                'action': parts[0],
+                'path': parts[2],
+                'last_modified': parts[1],
+                'size': current_size,
+            })
 
     return entries
 